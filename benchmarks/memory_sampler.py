@@ -0,0 +1,181 @@
+"""
+Memory instrumentation used by the performance runner. A child process records the runner's RSS at a fixed
+interval while a test runs, and a separate, optional tracemalloc pass attributes allocations to source lines
+(or, for extension-module code, to the test call).
+"""
+
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import psutil
+
+MIB = 1024 * 1024
+
+
+def tracemalloc_supported() -> bool:
+    """tracemalloc only hooks the CPython allocator; PyPy ships a stub module."""
+    return platform.python_implementation() == "CPython"
+
+
+def _sample_rss(pid: int, interval: float, conn):
+    """
+    Child process loop: poll the RSS of pid until the parent sends a stop message, then send back the timeline.
+
+    Sampling from another process, as memory_profiler does, keeps the rate independent of the GIL, so compiled
+    code that never releases it is sampled as densely as anything else.
+    """
+    process = psutil.Process(pid)
+    start_time = time.perf_counter()
+    timeline = []
+
+    def record():
+        timeline.append((time.perf_counter() - start_time, process.memory_info().rss / MIB))
+
+    record()
+    conn.send("ready")
+    while not conn.poll(interval):
+        record()
+    conn.recv()
+    record()
+    conn.send(timeline)
+    conn.close()
+
+
+class MemorySampler:
+    """
+    Record RSS from a separate sampling process while a block of code runs.
+
+    Usage:
+        sampler = MemorySampler(interval=0.001)
+        with sampler:
+            result = func(*args)
+        summary = sampler.summary()
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.timeline = []
+
+        self._conn = None
+        self._process = None
+
+    def start(self):
+        """Start the sampling process and wait until it has taken its baseline sample."""
+        self._conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_sample_rss, args=(os.getpid(), self.interval, child_conn), daemon=True
+        )
+        self._process.start()
+        self._conn.recv()
+
+    def stop(self):
+        """Stop sampling and collect the timeline."""
+        self._conn.send("stop")
+        self.timeline = self._conn.recv()
+        self._process.join()
+        self._conn.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
+        return False
+
+    def summary(self) -> dict:
+        """
+        Reduce the recorded timeline to summary metrics.
+
+        Returns:
+            dict: baseline, peak and steady-state RSS in MiB (steady state is the median sample, so short
+            transient peaks do not move it) and the timeline itself as [seconds, MiB] pairs.
+        """
+        usage = [mib for _, mib in self.timeline]
+        return {
+            "baseline_mib": usage[0],
+            "peak_mib": max(usage),
+            "steady_mib": statistics.median(usage),
+            "duration": self.timeline[-1][0],
+            "samples": len(self.timeline),
+            "timeline": [[round(t, 6), round(mib, 4)] for t, mib in self.timeline],
+        }
+
+
+class AllocationTracer:
+    """
+    Trace Python allocations with tracemalloc while a block of code runs.
+
+    Meant for its own pass: tracemalloc's bookkeeping inflates RSS, so it must not overlap a MemorySampler run.
+    The snapshot is taken when the block exits, so live_blocks and top_allocations describe blocks still alive
+    then (typically the result); traced_peak_mib also covers memory that was freed during the run.
+
+    tracemalloc attributes a block to the innermost Python frame. Extension-module (Cython) functions push no
+    frames, so everything they allocate would land on the caller's line; those blocks are reported under a
+    single "<label> (call level)" site instead. Such tests can only be attributed at the call level.
+
+    Usage:
+        tracer = AllocationTracer(top_n=10, label="module.func")
+        with tracer:
+            result = func(*args)
+        summary = tracer.summary()
+    """
+
+    def __init__(self, top_n: int = 10, label: str = "caller"):
+        self.top_n = top_n
+        self.label = label
+        self.live_blocks = None
+        self.traced_peak_mib = None
+        self.top_allocations = []
+
+        self._caller_file = None
+
+    def __enter__(self):
+        self._caller_file = sys._getframe(1).f_code.co_filename
+        tracemalloc.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.traced_peak_mib = tracemalloc.get_traced_memory()[1] / MIB
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            )
+        )
+        tracemalloc.stop()
+
+        stats = snapshot.statistics("lineno")
+        self.live_blocks = sum(stat.count for stat in stats)
+
+        # Blocks whose innermost frame is the caller were allocated by code with no Python frames of its own
+        call_level = {"site": f"{self.label} (call level)", "size_kib": 0.0, "count": 0}
+        allocations = []
+        for stat in stats:
+            frame = stat.traceback[0]
+            if frame.filename == self._caller_file:
+                call_level["size_kib"] += stat.size / 1024
+                call_level["count"] += stat.count
+            else:
+                allocations.append(
+                    {"site": f"{frame.filename}:{frame.lineno}", "size_kib": stat.size / 1024, "count": stat.count}
+                )
+        if call_level["count"]:
+            allocations.append(call_level)
+            allocations.sort(key=lambda allocation: allocation["size_kib"], reverse=True)
+
+        self.top_allocations = allocations[: self.top_n]
+        return False
+
+    def summary(self) -> dict:
+        """Live block count, traced peak in MiB and the top live allocation sites."""
+        return {
+            "live_blocks": self.live_blocks,
+            "traced_peak_mib": self.traced_peak_mib,
+            "top_allocations": self.top_allocations,
+        }
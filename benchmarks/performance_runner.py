@@ -1,22 +1,42 @@
 import argparse
 import csv
+import json
 import logging
+import math
+import re
 import statistics
 import sys
 import timeit
 import traceback
 from pathlib import Path
 
-import memory_profiler
 from tqdm import tqdm
 
+from benchmarks.memory_sampler import AllocationTracer
+from benchmarks.memory_sampler import MemorySampler
+from benchmarks.memory_sampler import tracemalloc_supported
+from benchmarks.roofline import calibrate
+from benchmarks.roofline import estimate_work
+from benchmarks.telemetry import Telemetry
+from benchmarks.telemetry import is_outlier
+from benchmarks.telemetry import relative_ci
+
 
 # Conditional imports based on implementation
 def get_imports(implementation: str):
     if implementation in ["cpython", "cython"]:
+        from src.numpy.cpu_test_cython import generate_batch_inputs as numpy_cython_cpu_batch_inputs
+        from src.numpy.cpu_test_cython import run_cpu_batch_test as numpy_cython_cpu_batch_test
         from src.numpy.cpu_test_cython import run_cpu_test as numpy_cython_cpu_test
+        from src.numpy.memory_test_cython import generate_batch_inputs as numpy_cython_memory_batch_inputs
+        from src.numpy.memory_test_cython import run_memory_batch_test as numpy_cython_memory_batch_test
         from src.numpy.memory_test_cython import run_memory_test as numpy_cython_memory_test
+        from src.numpy.stream_cython import triad as stream_cython_triad
+        from src.pure.cpu_test_cython import generate_batch_inputs as pure_cython_cpu_batch_inputs
+        from src.pure.cpu_test_cython import run_cpu_batch_test as pure_cython_cpu_batch_test
         from src.pure.cpu_test_cython import run_cpu_test as pure_cython_cpu_test
+        from src.pure.memory_test_cython import generate_batch_inputs as pure_cython_memory_batch_inputs
+        from src.pure.memory_test_cython import run_memory_batch_test as pure_cython_memory_batch_test
         from src.pure.memory_test_cython import run_memory_test as pure_cython_memory_test
         from src.pure.mixed_test_cython import run_mixed_test as pure_cython_mixed_test
     else:
@@ -26,11 +46,28 @@ def get_imports(implementation: str):
         pure_cython_cpu_test = None
         pure_cython_memory_test = None
         pure_cython_mixed_test = None
+        numpy_cython_cpu_batch_test = None
+        numpy_cython_memory_batch_test = None
+        pure_cython_cpu_batch_test = None
+        pure_cython_memory_batch_test = None
+        numpy_cython_cpu_batch_inputs = None
+        numpy_cython_memory_batch_inputs = None
+        pure_cython_cpu_batch_inputs = None
+        pure_cython_memory_batch_inputs = None
+        stream_cython_triad = None
 
     # Common imports
+    from src.numpy.cpu_test_numpy import generate_batch_inputs as numpy_python_cpu_batch_inputs
+    from src.numpy.cpu_test_numpy import run_cpu_batch_test as numpy_python_cpu_batch_test
     from src.numpy.cpu_test_numpy import run_cpu_test as numpy_python_cpu_test
+    from src.numpy.memory_test_python import generate_batch_inputs as numpy_python_memory_batch_inputs
+    from src.numpy.memory_test_python import run_memory_batch_test as numpy_python_memory_batch_test
     from src.numpy.memory_test_python import run_memory_test as numpy_python_memory_test
+    from src.pure.cpu_test_python import generate_batch_inputs as pure_python_cpu_batch_inputs
+    from src.pure.cpu_test_python import run_cpu_batch_test as pure_python_cpu_batch_test
     from src.pure.cpu_test_python import run_cpu_test as pure_python_cpu_test
+    from src.pure.memory_test_python import generate_batch_inputs as pure_python_memory_batch_inputs
+    from src.pure.memory_test_python import run_memory_batch_test as pure_python_memory_batch_test
     from src.pure.memory_test_python import run_memory_test as pure_python_memory_test
     from src.pure.mixed_test_python import run_mixed_test as pure_python_mixed_test
 
@@ -45,6 +82,23 @@ def get_imports(implementation: str):
         "pure_python_cpu_test": pure_python_cpu_test,
         "pure_python_memory_test": pure_python_memory_test,
         "pure_python_mixed_test": pure_python_mixed_test,
+        "numpy_cython_cpu_batch_test": numpy_cython_cpu_batch_test,
+        "numpy_cython_memory_batch_test": numpy_cython_memory_batch_test,
+        "pure_cython_cpu_batch_test": pure_cython_cpu_batch_test,
+        "pure_cython_memory_batch_test": pure_cython_memory_batch_test,
+        "numpy_python_cpu_batch_test": numpy_python_cpu_batch_test,
+        "numpy_python_memory_batch_test": numpy_python_memory_batch_test,
+        "pure_python_cpu_batch_test": pure_python_cpu_batch_test,
+        "pure_python_memory_batch_test": pure_python_memory_batch_test,
+        "numpy_cython_cpu_batch_inputs": numpy_cython_cpu_batch_inputs,
+        "numpy_cython_memory_batch_inputs": numpy_cython_memory_batch_inputs,
+        "pure_cython_cpu_batch_inputs": pure_cython_cpu_batch_inputs,
+        "pure_cython_memory_batch_inputs": pure_cython_memory_batch_inputs,
+        "numpy_python_cpu_batch_inputs": numpy_python_cpu_batch_inputs,
+        "numpy_python_memory_batch_inputs": numpy_python_memory_batch_inputs,
+        "pure_python_cpu_batch_inputs": pure_python_cpu_batch_inputs,
+        "pure_python_memory_batch_inputs": pure_python_memory_batch_inputs,
+        "stream_cython_triad": stream_cython_triad,
     }
 
 
@@ -53,6 +107,9 @@ sys.set_int_max_str_digits(0)
 DIVIDER = "=" * 50
 SUBDIV = "-" * 20
 
+# Test types whose functions solve batch_size small problems per call
+BATCH_TEST_TYPES = {"CPU Batch", "Memory Batch"}
+
 
 def setup_logging(implementation: str):
     """Basic logging setup for benchmark output."""
@@ -67,32 +124,103 @@ def setup_logging(implementation: str):
     logger.addHandler(handler)
 
 
-def measure_performance(func, *args, num_runs: int = 30, verbose: bool = False):
-    """Measure performance metrics for a given function."""
+def measure_performance(
+    func,
+    *args,
+    num_runs: int = 30,
+    memory_interval: float = 0.001,
+    trace_allocations: bool = False,
+    top_allocations: int = 10,
+    telemetry: Telemetry = None,
+    event_fields: dict = None,
+    settle_threshold: float = 0.0,
+    min_runs: int = 3,
+    tests_completed: int = 0,
+    tests_total: int = 1,
+    mean_test_seconds: float = None,
+    verbose: bool = False,
+):
+    """
+    Measure performance metrics for a given function.
+
+    Emits an "iteration" telemetry event after every run and stops early once the relative 95% confidence
+    interval of the mean time drops below settle_threshold (0 disables early stopping). The run-level ETA
+    assumes each queued test takes mean_test_seconds, or as long as this one until a test has finished.
+    """
     logging.info(f"Starting performance measurement for {func.__module__}.{func.__name__}")
     logging.info(f"Arguments: {args}")
 
+    event_fields = event_fields or {}
     times = []
-    memory_usages = []
+    memory_runs = []
+    wall_times = []
 
     iterator = tqdm(range(num_runs), desc="Running tests", leave=False)
-    for _ in iterator:
+    for iteration in iterator:
+        iteration_start = timeit.default_timer()
+        run_time = None
+        outlier = False
+        status = "ok"
         try:
             # Time measurement
             start_time = timeit.default_timer()
             func(*args)
             end_time = timeit.default_timer()
             run_time = end_time - start_time
+            outlier = is_outlier(times, run_time)
             times.append(run_time)
-
-            # Memory measurement
-            memory_usage = memory_profiler.memory_usage((func, args), max_iterations=1)
-            memory_usages.append(memory_usage[0])
+            if outlier:
+                logging.warning(f"Iteration {iteration + 1} is an outlier: {run_time:.4f} seconds")
+
+            # Memory measurement, in a separate call so sampling doesn't perturb the timing
+            sampler = MemorySampler(interval=memory_interval)
+            with sampler:
+                result = func(*args)
+            del result
+            memory_run = sampler.summary()
+
+            # Allocation tracing gets its own call so tracemalloc's overhead stays out of the RSS numbers
+            if trace_allocations and tracemalloc_supported():
+                tracer = AllocationTracer(top_n=top_allocations, label=f"{func.__module__}.{func.__name__}")
+                with tracer:
+                    result = func(*args)
+                del result
+                memory_run.update(tracer.summary())
+            memory_runs.append(memory_run)
 
         except Exception as e:
+            status = "error"
             logging.error(f"Error in run: {e}")
             traceback.print_exc()
-            continue
+
+        wall_times.append(timeit.default_timer() - iteration_start)
+        rel_ci = relative_ci(times)
+        eta = statistics.mean(wall_times) * (num_runs - iteration - 1)
+        test_seconds = mean_test_seconds if mean_test_seconds is not None else sum(wall_times) + eta
+
+        if telemetry is not None:
+            telemetry.emit(
+                "iteration",
+                **event_fields,
+                iteration=iteration + 1,
+                num_runs=num_runs,
+                status=status,
+                time=run_time,
+                peak_mib=memory_runs[-1]["peak_mib"] if status == "ok" else None,
+                mean_time=statistics.mean(times) if times else None,
+                relative_ci=rel_ci if math.isfinite(rel_ci) else None,
+                outlier=outlier,
+                eta_seconds=eta,
+                tests_completed=tests_completed,
+                tests_total=tests_total,
+                run_eta_seconds=eta + test_seconds * (tests_total - tests_completed - 1),
+            )
+
+        if settle_threshold > 0 and len(times) >= min_runs and rel_ci <= settle_threshold:
+            logging.info(f"Result settled after {len(times)} runs (relative CI {rel_ci:.2%}), stopping early")
+            if telemetry is not None:
+                telemetry.emit("test_settled", **event_fields, iteration=iteration + 1, relative_ci=rel_ci)
+            break
 
     if not times:
         logging.error("No successful runs completed!")
@@ -100,23 +228,58 @@ def measure_performance(func, *args, num_runs: int = 30, verbose: bool = False):
 
     avg_time = statistics.mean(times)
     std_time = statistics.stdev(times) if len(times) > 1 else 0
-    avg_memory = statistics.mean(memory_usages)
-    std_memory = statistics.stdev(memory_usages) if len(memory_usages) > 1 else 0
+    peak_memories = [run["peak_mib"] for run in memory_runs]
+    avg_memory = statistics.mean(peak_memories)
+    std_memory = statistics.stdev(peak_memories) if len(peak_memories) > 1 else 0
+    avg_steady_memory = statistics.mean(run["steady_mib"] for run in memory_runs)
+    live_blocks = [run["live_blocks"] for run in memory_runs if "live_blocks" in run]
+    avg_live_blocks = statistics.mean(live_blocks) if live_blocks else None
 
     return {
+        "runs": len(times),
         "avg_time": avg_time,
         "std_time": std_time,
         "avg_memory": avg_memory,
         "std_memory": std_memory,
+        "avg_steady_memory": avg_steady_memory,
+        "avg_live_blocks": avg_live_blocks,
+        "memory_runs": memory_runs,
     }
 
 
+def save_memory_timeline(output_dir: Path, implementation: str, test_name: str, test_type: str, results: dict):
+    """Write the per-run memory timelines and allocation sites of one test to a JSON file."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    slug = re.sub(r"[^a-z0-9]+", "_", test_name.lower()).strip("_")
+    with open(output_dir / f"{slug}.json", "w") as f:
+        json.dump(
+            {
+                "implementation": implementation,
+                "test_name": test_name,
+                "test_type": test_type,
+                "runs": results["memory_runs"],
+            },
+            f,
+        )
+
+
 def run_benchmarks(
     implementation: str,
     num_runs: int,
     prime_upper_bound: int,
     matrix_dimension: int,
     fibonacci_length: int,
+    batch_size: int = 0,
+    batch_matrix_dimension: int = 8,
+    batch_prime_bound: int = 10_000,
+    memory_interval: float = 0.001,
+    trace_allocations: bool = False,
+    top_allocations: int = 10,
+    stream_size: int = 10_000_000,
+    peak_matrix_dimension: int = 1024,
+    telemetry: Telemetry = None,
+    settle_threshold: float = 0.0,
+    min_runs: int = 3,
     verbose: bool = False,
 ):
     """
@@ -128,13 +291,27 @@ def run_benchmarks(
         prime_upper_bound (int): Upper bound for prime number calculations
         matrix_dimension (int): Size of NxN matrices for multiplication
         fibonacci_length (int): Number of Fibonacci numbers to calculate
+        batch_size (int): Number of small problems per call in throughput mode (0 disables it)
+        batch_matrix_dimension (int): Size of NxN matrices used in throughput mode
+        batch_prime_bound (int): Largest candidate checked for primality in throughput mode
+        memory_interval (float): Seconds between RSS samples during the memory measurement
+        trace_allocations (bool): Record top allocation sites with tracemalloc in an extra call (CPython only)
+        top_allocations (int): Number of allocation sites to keep per run
+        stream_size (int): Number of doubles per array in the bandwidth calibration
+        peak_matrix_dimension (int): Size of NxN matrices in the peak FLOP calibration
+        telemetry (Telemetry): Optional live event stream
+        settle_threshold (float): Stop a test early once the relative CI of its mean time is below this (0 disables)
+        min_runs (int): Minimum number of runs before a test may stop early
         verbose (bool): Enable verbose logging
     """
     logging.info(f"\n{DIVIDER}\nRunning {implementation} benchmarks\n{DIVIDER}")
     logging.info(f"Number of runs: {num_runs}")
     logging.info(f"Prime number upper bound: {prime_upper_bound}")
     logging.info(f"Matrix dimension: {matrix_dimension}")
-    logging.info(f"Fibonacci sequence length: {fibonacci_length}\n")
+    logging.info(f"Fibonacci sequence length: {fibonacci_length}")
+    logging.info(f"Batch size: {batch_size}")
+    logging.info(f"Batch matrix dimension: {batch_matrix_dimension}")
+    logging.info(f"Batch prime bound: {batch_prime_bound}\n")
 
     imports = get_imports(implementation)
 
@@ -146,6 +323,16 @@ def run_benchmarks(
     pure_dir.mkdir(parents=True, exist_ok=True)
     numpy_dir.mkdir(parents=True, exist_ok=True)
 
+    # Calibrate host bandwidth and peak FLOP rate once, for roofline metrics in results_processor
+    logging.info("Calibrating memory bandwidth and peak FLOP rate...")
+    calibration = calibrate(stream_size, peak_matrix_dimension, cython_triad=imports["stream_cython_triad"])
+    logging.info(f"  Peak bandwidth: {calibration['peak_gbs']:.2f} GB/s")
+    logging.info(f"  Peak FLOP rate: {calibration['peak_gflops']:.2f} GFLOP/s\n")
+    with open(impl_dir / "calibration.json", "w") as f:
+        json.dump(calibration, f, indent=2)
+    if telemetry is not None:
+        telemetry.emit("calibration", implementation=implementation, **calibration)
+
     # Initialize results lists
     pure_results = []
     numpy_results = []
@@ -159,6 +346,13 @@ def run_benchmarks(
         "Time Std Dev",
         "Memory (MiB)",
         "Memory Std Dev",
+        "Ops/sec",
+        "Steady Memory (MiB)",
+        "Live Blocks",
+        "Work (FLOP)",
+        "Work (bytes)",
+        "GFLOP/s",
+        "GB/s",
     ]
 
     # Determine which test modules to use based on implementation
@@ -223,22 +417,107 @@ def run_benchmarks(
             (imports["pure_python_mixed_test"], "Mixed Test (Pure PyPy)", (fibonacci_length,), pure_results, "Mixed"),
         ]
 
+    # Throughput mode: many small problems per call, so per-call overhead dominates
+    batch_inputs = {}
+    if batch_size > 0:
+        flavour = "cython" if implementation == "cython" else "python"
+        label = {"cpython": "Python", "cython": "Cython", "pypy": "PyPy"}[implementation]
+        # Builders turning a batch test's size arguments into its input data
+        batch_inputs = {
+            f"CPU Batch Test (Pure {label})": imports[f"pure_{flavour}_cpu_batch_inputs"],
+            f"CPU Batch Test (NumPy {label})": imports[f"numpy_{flavour}_cpu_batch_inputs"],
+            f"Memory Batch Test (Pure {label})": imports[f"pure_{flavour}_memory_batch_inputs"],
+            f"Memory Batch Test (NumPy {label})": imports[f"numpy_{flavour}_memory_batch_inputs"],
+        }
+        test_cases += [
+            (
+                imports[f"pure_{flavour}_cpu_batch_test"],
+                f"CPU Batch Test (Pure {label})",
+                (batch_prime_bound, batch_size),
+                pure_results,
+                "CPU Batch",
+            ),
+            (
+                imports[f"numpy_{flavour}_cpu_batch_test"],
+                f"CPU Batch Test (NumPy {label})",
+                (batch_prime_bound, batch_size),
+                numpy_results,
+                "CPU Batch",
+            ),
+            (
+                imports[f"pure_{flavour}_memory_batch_test"],
+                f"Memory Batch Test (Pure {label})",
+                (batch_matrix_dimension, batch_size),
+                pure_results,
+                "Memory Batch",
+            ),
+            (
+                imports[f"numpy_{flavour}_memory_batch_test"],
+                f"Memory Batch Test (NumPy {label})",
+                (batch_matrix_dimension, batch_size),
+                numpy_results,
+                "Memory Batch",
+            ),
+        ]
+
+    tests_total = sum(1 for test_case in test_cases if test_case[0] is not None)
+    tests_completed = 0
+    test_wall_times = []
+    if telemetry is not None:
+        telemetry.emit("run_start", implementation=implementation, num_runs=num_runs, tests_total=tests_total)
+
     # Run benchmarks
     for test_func, test_name, test_args, results_list, test_type in test_cases:
         if test_func is None:
             logging.info(f"\n{test_name} not available for {implementation}")
             continue
 
+        event_fields = {"implementation": implementation, "test": test_name}
+        if telemetry is not None:
+            telemetry.emit("test_start", **event_fields, test_type=test_type, num_runs=num_runs)
+
         logging.info("\n--------------------")
         logging.info(f"Running {test_name}")
         logging.info("--------------------")
 
+        test_start = timeit.default_timer()
         try:
-            results = measure_performance(test_func, *test_args, num_runs=num_runs, verbose=verbose)
+            # Batch inputs are generated once per test so their cost never lands in the timed calls
+            call_args = batch_inputs[test_name](*test_args) if test_name in batch_inputs else test_args
+            results = measure_performance(
+                test_func,
+                *call_args,
+                num_runs=num_runs,
+                memory_interval=memory_interval,
+                trace_allocations=trace_allocations,
+                top_allocations=top_allocations,
+                telemetry=telemetry,
+                event_fields=event_fields,
+                settle_threshold=settle_threshold,
+                min_runs=min_runs,
+                tests_completed=tests_completed,
+                tests_total=tests_total,
+                mean_test_seconds=statistics.mean(test_wall_times) if test_wall_times else None,
+                verbose=verbose,
+            )
+            test_wall_times.append(timeit.default_timer() - test_start)
+            ops_per_call = batch_size if test_type in BATCH_TEST_TYPES else 1
+            ops_per_sec = ops_per_call / results["avg_time"] if results["avg_time"] > 0 else 0
+            variant = "numpy" if results_list is numpy_results else "pure"
+            work_flops, work_bytes = estimate_work(test_type, variant, implementation, *test_args)
+            # Rates come from the unrounded time; the CSV time column is rounded and can read 0.0000
+            gflops = gbs = None
+            if work_flops is not None and results["avg_time"] > 0:
+                gflops = work_flops / results["avg_time"] / 1e9
+                gbs = work_bytes / results["avg_time"] / 1e9
 
             logging.info("Performance Summary:")
             logging.info(f"  Average Time: {results['avg_time']:.4f} ± {results['std_time']:.4f} seconds")
-            logging.info(f"  Average Memory: {results['avg_memory']:.4f} ± {results['std_memory']:.4f} MiB")
+            logging.info(f"  Average Peak Memory: {results['avg_memory']:.4f} ± {results['std_memory']:.4f} MiB")
+            logging.info(f"  Average Steady Memory: {results['avg_steady_memory']:.4f} MiB")
+            if results["avg_live_blocks"] is not None:
+                logging.info(f"  Average Live Blocks: {results['avg_live_blocks']:.0f}")
+            logging.info(f"  Throughput: {ops_per_sec:.2f} ops/sec")
             logging.info("--------------------\n")
 
             # Add results to appropriate list
@@ -251,14 +530,48 @@ def run_benchmarks(
                     f"{results['std_time']:.4f}",
                     f"{results['avg_memory']:.4f}",
                     f"{results['std_memory']:.4f}",
+                    f"{ops_per_sec:.2f}",
+                    f"{results['avg_steady_memory']:.4f}",
+                    f"{results['avg_live_blocks']:.0f}" if results["avg_live_blocks"] is not None else "",
+                    f"{work_flops:.6g}" if work_flops is not None else "",
+                    f"{work_bytes:.6g}" if work_bytes is not None else "",
+                    f"{gflops:.6g}" if gflops is not None else "",
+                    f"{gbs:.6g}" if gbs is not None else "",
                 ]
             )
 
+            variant_dir = numpy_dir if variant == "numpy" else pure_dir
+            save_memory_timeline(variant_dir / "timelines", implementation, test_name, test_type, results)
+
+            if telemetry is not None:
+                telemetry.emit(
+                    "test_end",
+                    **event_fields,
+                    runs=results["runs"],
+                    avg_time=results["avg_time"],
+                    std_time=results["std_time"],
+                    avg_memory=results["avg_memory"],
+                    ops_per_sec=ops_per_sec,
+                    tests_completed=tests_completed + 1,
+                    tests_total=tests_total,
+                    run_eta_seconds=statistics.mean(test_wall_times) * (tests_total - tests_completed - 1),
+                )
+
         except Exception as e:
             logging.error(f"Error running {test_name}: {str(e)}")
+            if telemetry is not None:
+                telemetry.emit(
+                    "test_error",
+                    **event_fields,
+                    error=str(e),
+                    tests_completed=tests_completed + 1,
+                    tests_total=tests_total,
+                )
             if verbose:
                 traceback.print_exc()
 
+        tests_completed += 1
+
     # Save results to CSV files
     if pure_results:
         with open(pure_dir / f"{implementation}_pure_results.csv", "w", newline="") as f:
@@ -272,6 +585,9 @@ def run_benchmarks(
             writer.writerow(headers)
             writer.writerows(numpy_results)
 
+    if telemetry is not None:
+        telemetry.emit("run_end", implementation=implementation)
+
 
 def main():
     parser = argparse.ArgumentParser(description="Run performance benchmarks")
@@ -287,6 +603,62 @@ def main():
     )
     parser.add_argument("--matrix-dimension", type=int, required=True, help="Size of NxN matrices for multiplication")
     parser.add_argument("--fibonacci-length", type=int, required=True, help="Number of Fibonacci numbers to calculate")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=0,
+        help="Number of small problems per call in throughput mode (0 disables throughput tests)",
+    )
+    parser.add_argument(
+        "--batch-matrix-dimension", type=int, default=8, help="Size of NxN matrices used in throughput mode"
+    )
+    parser.add_argument(
+        "--batch-prime-bound",
+        type=int,
+        default=10_000,
+        help="Largest candidate checked for primality in throughput mode",
+    )
+    parser.add_argument(
+        "--memory-sample-interval",
+        type=float,
+        default=0.001,
+        help="Seconds between RSS samples during the memory measurement",
+    )
+    parser.add_argument(
+        "--trace-allocations",
+        action="store_true",
+        help="Record top allocation sites with tracemalloc (CPython only)",
+    )
+    parser.add_argument("--top-allocations", type=int, default=10, help="Number of allocation sites to keep per run")
+    parser.add_argument(
+        "--stream-size",
+        type=int,
+        default=10_000_000,
+        help="Number of doubles per array in the memory bandwidth calibration",
+    )
+    parser.add_argument(
+        "--peak-matrix-dimension",
+        type=int,
+        default=1024,
+        help="Size of NxN matrices in the peak FLOP rate calibration",
+    )
+    parser.add_argument(
+        "--telemetry",
+        help="Stream JSONL progress events to this file, or to a listening Unix socket given as unix:/path",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=0,
+        help="Serve Prometheus text metrics on 127.0.0.1 at this port (0 disables it)",
+    )
+    parser.add_argument(
+        "--settle-threshold",
+        type=float,
+        default=0.0,
+        help="Stop a test early once the relative 95%% CI of its mean time is below this (0 disables it)",
+    )
+    parser.add_argument("--min-runs", type=int, default=3, help="Minimum number of runs before a test may stop early")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose output")
 
     args = parser.parse_args()
@@ -301,16 +673,33 @@ def main():
     else:
         implementations_to_run = args.implementations
 
+    telemetry = Telemetry(args.telemetry, args.metrics_port) if args.telemetry or args.metrics_port else None
+
     # Run benchmarks for specified implementations
-    for impl in implementations_to_run:
-        run_benchmarks(
-            implementation=impl,
-            num_runs=args.runs,
-            prime_upper_bound=args.prime_upper_bound,
-            matrix_dimension=args.matrix_dimension,
-            fibonacci_length=args.fibonacci_length,
-            verbose=args.verbose,
-        )
+    try:
+        for impl in implementations_to_run:
+            run_benchmarks(
+                implementation=impl,
+                num_runs=args.runs,
+                prime_upper_bound=args.prime_upper_bound,
+                matrix_dimension=args.matrix_dimension,
+                fibonacci_length=args.fibonacci_length,
+                batch_size=args.batch_size,
+                batch_matrix_dimension=args.batch_matrix_dimension,
+                batch_prime_bound=args.batch_prime_bound,
+                memory_interval=args.memory_sample_interval,
+                trace_allocations=args.trace_allocations,
+                top_allocations=args.top_allocations,
+                stream_size=args.stream_size,
+                peak_matrix_dimension=args.peak_matrix_dimension,
+                telemetry=telemetry,
+                settle_threshold=args.settle_threshold,
+                min_runs=args.min_runs,
+                verbose=args.verbose,
+            )
+    finally:
+        if telemetry is not None:
+            telemetry.close()
 
 
 if __name__ == "__main__":
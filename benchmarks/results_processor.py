@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 import glob
+import json
 import os
 from datetime import datetime
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
 
@@ -86,6 +88,168 @@ def plot_results(combined_csv):
     plt.close()
 
 
+def plot_throughput(combined_csv):
+    """Plot operations per second for the batched throughput tests, if any were run."""
+    df = pd.read_csv(combined_csv)
+    if "Ops/sec" not in df.columns:
+        return
+
+    df = df[df["Test Type"].str.endswith("Batch")]
+    if df.empty:
+        return
+
+    df["Type"] = df["Test Name"].apply(lambda x: "NumPy" if "NumPy" in x else "Pure")
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+
+    for data, ax, title in [
+        (df[df["Type"] == "Pure"], ax1, "Pure - Throughput"),
+        (df[df["Type"] == "NumPy"], ax2, "NumPy - Throughput"),
+    ]:
+        sns.barplot(data=data, x="Test Type", y="Ops/sec", hue="Implementation", ax=ax)
+        ax.set_title(title)
+        ax.set_yscale("log")
+        for container in ax.containers:
+            ax.bar_label(container, fmt="%.2g")
+
+    if ax2.get_legend() is not None:
+        ax2.get_legend().remove()
+
+    plt.suptitle("Throughput Comparison (operations per second)", fontsize=14)
+    plt.tight_layout()
+    plt.savefig(
+        os.path.join(os.path.dirname(combined_csv), f'throughput_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png')
+    )
+    plt.close()
+
+
+def plot_memory_timelines(results_dir):
+    """Plot the RSS timeline of the last run of every test, one panel per test type."""
+    timelines = []
+    for timeline_file in sorted(glob.glob(os.path.join(results_dir, "*", "*", "timelines", "*.json"))):
+        with open(timeline_file) as f:
+            data = json.load(f)
+        if data["runs"]:
+            timelines.append(data)
+
+    if not timelines:
+        return
+
+    test_types = sorted({data["test_type"] for data in timelines})
+    fig, axes = plt.subplots(len(test_types), 1, figsize=(15, 4 * len(test_types)), squeeze=False)
+
+    for ax, test_type in zip(axes[:, 0], test_types):
+        for data in timelines:
+            if data["test_type"] != test_type:
+                continue
+            run = data["runs"][-1]
+            t, mib = zip(*run["timeline"])
+            ax.plot(t, mib, label=f"{data['implementation']} - {data['test_name']}")
+            ax.axhline(run["steady_mib"], linestyle="--", linewidth=0.8, color=ax.lines[-1].get_color())
+        ax.set_title(f"{test_type} - Memory Timeline")
+        ax.set_xlabel("Time (seconds)")
+        ax.set_ylabel("RSS (MiB)")
+        ax.legend(fontsize="small")
+
+    plt.suptitle("Memory Timelines (dashed: steady state)", fontsize=14)
+    plt.tight_layout()
+    plt.savefig(os.path.join(results_dir, f'memory_timelines_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'))
+    plt.close()
+
+
+def load_calibration(results_dir):
+    """Combine the per-implementation calibration files into host peaks (best measurement wins)."""
+    calibrations = []
+    for calibration_file in glob.glob(os.path.join(results_dir, "*", "calibration.json")):
+        with open(calibration_file) as f:
+            calibrations.append(json.load(f))
+
+    if not calibrations:
+        return None
+
+    return {
+        "peak_gflops": max(c["peak_gflops"] for c in calibrations),
+        "peak_gbs": max(c["peak_gbs"] for c in calibrations),
+    }
+
+
+def compute_roofline_metrics(combined_csv, calibration):
+    """Derive percent-of-peak per test from the achieved GFLOP/s and GB/s the runner computed from unrounded times."""
+    df = pd.read_csv(combined_csv)
+    if "GFLOP/s" not in df.columns:
+        return None
+
+    df = df.dropna(subset=["Work (FLOP)", "Work (bytes)", "GFLOP/s", "GB/s"]).copy()
+    if df.empty:
+        return None
+
+    df["Arithmetic Intensity"] = df["Work (FLOP)"] / df["Work (bytes)"]
+    df["% Peak FLOP/s"] = 100 * df["GFLOP/s"] / calibration["peak_gflops"]
+    df["% Peak Bandwidth"] = 100 * df["GB/s"] / calibration["peak_gbs"]
+    attainable = np.minimum(calibration["peak_gflops"], df["Arithmetic Intensity"] * calibration["peak_gbs"])
+    df["% Roofline"] = 100 * df["GFLOP/s"] / attainable
+
+    columns = [
+        "Implementation",
+        "Test Type",
+        "Test Name",
+        "GFLOP/s",
+        "GB/s",
+        "Arithmetic Intensity",
+        "% Peak FLOP/s",
+        "% Peak Bandwidth",
+        "% Roofline",
+    ]
+    roofline_csv = os.path.join(
+        os.path.dirname(combined_csv), f'roofline_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+    )
+    df[columns].to_csv(roofline_csv, index=False, float_format="%.4g")
+
+    return df[columns]
+
+
+def plot_roofline(metrics, calibration, results_dir):
+    """Draw a roofline chart with one point per implementation and test."""
+    peak_gflops = calibration["peak_gflops"]
+    peak_gbs = calibration["peak_gbs"]
+
+    fig, ax = plt.subplots(figsize=(12, 8))
+
+    ridge = peak_gflops / peak_gbs
+    intensity = np.logspace(
+        np.log10(min(metrics["Arithmetic Intensity"].min(), ridge) / 10),
+        np.log10(max(metrics["Arithmetic Intensity"].max(), ridge) * 10),
+        200,
+    )
+    ax.plot(intensity, np.minimum(peak_gflops, intensity * peak_gbs), color="black", linewidth=2)
+    ax.annotate(
+        f"{peak_gbs:.1f} GB/s", (intensity[0], intensity[0] * peak_gbs), textcoords="offset points", xytext=(5, 5)
+    )
+    ax.annotate(f"{peak_gflops:.1f} GFLOP/s", (intensity[-1], peak_gflops), textcoords="offset points", xytext=(-90, 5))
+
+    sns.scatterplot(
+        data=metrics, x="Arithmetic Intensity", y="GFLOP/s", hue="Implementation", style="Test Type", s=80, ax=ax
+    )
+    for _, row in metrics.iterrows():
+        ax.annotate(
+            row["Test Name"],
+            (row["Arithmetic Intensity"], row["GFLOP/s"]),
+            fontsize="x-small",
+            textcoords="offset points",
+            xytext=(4, -8),
+        )
+
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlabel("Arithmetic Intensity (FLOP/byte)")
+    ax.set_ylabel("Achieved GFLOP/s")
+    ax.set_title("Roofline")
+
+    plt.tight_layout()
+    plt.savefig(os.path.join(results_dir, f'roofline_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'))
+    plt.close()
+
+
 def main():
     """Process results and generate plots."""
     import sys
@@ -98,6 +262,15 @@ def main():
     try:
         combined_csv = process_results_directory(results_dir)
         plot_results(combined_csv)
+        plot_throughput(combined_csv)
+        plot_memory_timelines(results_dir)
+
+        calibration = load_calibration(results_dir)
+        if calibration is not None:
+            metrics = compute_roofline_metrics(combined_csv, calibration)
+            if metrics is not None:
+                print(metrics.to_string(index=False, float_format=lambda x: f"{x:.4g}"))
+                plot_roofline(metrics, calibration, results_dir)
         print("Results processed and plots generated in results/")
     except Exception as e:
         print(f"Error: {e}")
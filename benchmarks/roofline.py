@@ -0,0 +1,197 @@
+"""
+Roofline support for the performance runner: a once-per-run calibration of the host's memory bandwidth
+(STREAM-like triad) and peak FLOP rate, plus the analytic work each test type performs per call.
+
+Work is counted for the algorithm each variant actually runs: the NumPy prime tests sieve (the Cython build
+with a mod-30 wheel that skips multiples of 2, 3 and 5), while the pure Python and pure Cython ones use
+6k +/- 1 trial division per candidate. The prime and Fibonacci tests are
+integer workloads; their operations are counted as FLOP-equivalents so they can share the roofline chart
+with matrix multiplication.
+"""
+
+import math
+import timeit
+
+import numpy as np
+
+BYTES_PER_DOUBLE = 8
+
+# Residues modulo 30 that are coprime to 2, 3 and 5, i.e. the spokes of the mod-30 wheel
+WHEEL_RESIDUES = (1, 7, 11, 13, 17, 19, 23, 29)
+
+
+def _sieving_primes(limit: int) -> list:
+    """Primes p with p * p <= limit, i.e. the primes a sieve up to limit crosses off multiples of."""
+    root = math.isqrt(limit)
+    is_prime = [True] * (root + 1)
+    primes = []
+    for i in range(2, root + 1):
+        if is_prime[i]:
+            primes.append(i)
+            for j in range(i * i, root + 1, i):
+                is_prime[j] = False
+    return primes
+
+
+def _wheel_count(x: int) -> int:
+    """Number of integers in [1, x] coprime to 30."""
+    return len(WHEEL_RESIDUES) * (x // 30) + sum(1 for r in WHEEL_RESIDUES if r <= x % 30)
+
+
+def _wheel_marks(limit: int) -> int:
+    """Marks of a mod-30 wheel sieve up to limit: p * m for each prime p >= 7 and wheel cofactor p <= m <= limit / p."""
+    return sum(_wheel_count(limit // p) - _wheel_count(p - 1) for p in _sieving_primes(limit) if p >= 7)
+
+
+def sieve_work(limit: int):
+    """Sieve of Eratosthenes up to limit: each prime p <= sqrt(limit) marks p*p, p*p + p, ... in a byte array."""
+    marks = sum((limit - p * p) // p + 1 for p in _sieving_primes(limit))
+    return marks, limit + marks
+
+
+def wheel_sieve_work(limit: int):
+    """
+    Mod-30 wheel sieve up to limit, as the Cython NumPy build runs it.
+
+    Multiples of 2, 3 and 5 are removed by the fill pass, so each prime p >= 7 only marks p * m for the wheel
+    cofactors p <= m <= limit / p (~8/30 of them). Bytes cover the limit-byte fill, the marks and the two gather
+    passes (count, then write) over the wheel candidates.
+    """
+    marks = _wheel_marks(limit)
+    return marks, limit + marks + 2 * _wheel_count(limit)
+
+
+def trial_division_check_work(limit: int) -> float:
+    """
+    Expected divisions for one 6k +/- 1 trial-division check of a uniform candidate in [2, limit].
+
+    A prime n costs ~sqrt(n)/3 divisions and composites mostly exit after one or two, so averaging over the
+    ~1/ln(n) share of primes gives ~1 + (2/9) * sqrt(limit) / ln(limit).
+    """
+    if limit < 3:
+        return 1
+    return 1 + 2 / 9 * math.sqrt(limit) / math.log(limit)
+
+
+def trial_division_work(limit: int):
+    """Trial division of every integer up to limit, collecting the ~limit/ln(limit) primes into a list."""
+    primes = limit / math.log(limit) if limit > 2 else 1
+    return limit * trial_division_check_work(limit), primes * BYTES_PER_DOUBLE
+
+
+def matmul_work(matrix_size: int, batch_size: int = 1):
+    """NxN matrix multiplication: 2*N^3 flops, reading A and B and writing C once each."""
+    flops = 2 * matrix_size**3 * batch_size
+    bytes_moved = 3 * matrix_size**2 * BYTES_PER_DOUBLE * batch_size
+    return flops, bytes_moved
+
+
+def sieve_batch_work(limit: int, batch_size: int):
+    """Batched primality checks with a sieve: one sieve up to limit, then a lookup per candidate."""
+    ops, bytes_moved = sieve_work(limit)
+    return ops + batch_size, bytes_moved + batch_size * (BYTES_PER_DOUBLE + 1)
+
+
+def wheel_sieve_batch_work(limit: int, batch_size: int):
+    """Batched primality checks with the wheel sieve: one fill and marking pass, then a lookup per candidate."""
+    marks = _wheel_marks(limit)
+    return marks + batch_size, limit + marks + batch_size * (BYTES_PER_DOUBLE + 1)
+
+
+def trial_division_batch_work(limit: int, batch_size: int):
+    """Batched primality checks by trial division: only the per-candidate divisions, no sieve."""
+    return batch_size * trial_division_check_work(limit), batch_size * (BYTES_PER_DOUBLE + 1)
+
+
+def fibonacci_work(length: int):
+    """Fibonacci numbers 0..length-1, each computed iteratively: ~length^2 / 2 additions."""
+    return length * (length - 1) / 2, length * BYTES_PER_DOUBLE
+
+
+# Analytic (flops, bytes) per call, keyed by the runner's (test type, variant) and called with the test's arguments
+WORK_MODELS = {
+    ("CPU", "pure"): trial_division_work,
+    ("CPU", "numpy"): sieve_work,
+    ("Memory", "pure"): matmul_work,
+    ("Memory", "numpy"): matmul_work,
+    ("Mixed", "pure"): fibonacci_work,
+    ("CPU Batch", "pure"): trial_division_batch_work,
+    ("CPU Batch", "numpy"): sieve_batch_work,
+    ("Memory Batch", "pure"): matmul_work,
+    ("Memory Batch", "numpy"): matmul_work,
+}
+
+# Implementations whose variant runs a different algorithm, keyed by (test type, variant, implementation)
+IMPLEMENTATION_WORK_MODELS = {
+    ("CPU", "numpy", "cython"): wheel_sieve_work,
+    ("CPU Batch", "numpy", "cython"): wheel_sieve_batch_work,
+}
+
+
+def estimate_work(test_type: str, variant: str, implementation: str, *args):
+    """Return the analytic (flops, bytes) of one call of a test variant, or (None, None) if it has no model."""
+    model = IMPLEMENTATION_WORK_MODELS.get((test_type, variant, implementation), WORK_MODELS.get((test_type, variant)))
+    if model is None:
+        return None, None
+    return model(*args)
+
+
+def best_time(func, repeats: int) -> float:
+    """Fastest of several timed calls, as STREAM reports."""
+    times = []
+    for _ in range(repeats):
+        start = timeit.default_timer()
+        func()
+        times.append(timeit.default_timer() - start)
+    return min(times)
+
+
+def measure_bandwidth(stream_size: int, repeats: int = 10, cython_triad=None) -> dict:
+    """
+    Measure memory bandwidth with a STREAM-like triad a = b + s * c.
+
+    The NumPy version needs two passes (multiply into a, then add b), so it moves 40 bytes per element;
+    the Cython kernel does it in one pass and moves the STREAM-standard 24.
+
+    Args:
+        stream_size: Number of doubles per array; should be well beyond the last-level cache
+        repeats: Number of timed repetitions, the fastest is kept
+        cython_triad: Optional compiled triad(a, b, c, scalar) kernel
+
+    Returns:
+        dict: Bandwidth in GB/s per kernel and the best of them as "peak_gbs"
+    """
+    a = np.zeros(stream_size)
+    b = np.random.rand(stream_size)
+    c = np.random.rand(stream_size)
+    scalar = 3.0
+
+    def numpy_triad():
+        np.multiply(c, scalar, out=a)
+        np.add(a, b, out=a)
+
+    results = {"numpy_triad_gbs": 5 * BYTES_PER_DOUBLE * stream_size / best_time(numpy_triad, repeats) / 1e9}
+    if cython_triad is not None:
+        elapsed = best_time(lambda: cython_triad(a, b, c, scalar), repeats)
+        results["cython_triad_gbs"] = 3 * BYTES_PER_DOUBLE * stream_size / elapsed / 1e9
+
+    results["peak_gbs"] = max(results.values())
+    return results
+
+
+def measure_peak_flops(matrix_size: int, repeats: int = 5) -> dict:
+    """Estimate attainable peak FLOP rate from the fastest BLAS matrix multiplication of NxN matrices."""
+    A = np.random.rand(matrix_size, matrix_size)
+    B = np.random.rand(matrix_size, matrix_size)
+    elapsed = best_time(lambda: np.matmul(A, B), repeats)
+    return {"peak_gflops": 2 * matrix_size**3 / elapsed / 1e9}
+
+
+def calibrate(stream_size: int, peak_matrix_dimension: int, cython_triad=None) -> dict:
+    """Run the bandwidth and peak FLOP probes once and return all measurements."""
+    return {
+        "stream_size": stream_size,
+        "peak_matrix_dimension": peak_matrix_dimension,
+        **measure_bandwidth(stream_size, cython_triad=cython_triad),
+        **measure_peak_flops(peak_matrix_dimension),
+    }
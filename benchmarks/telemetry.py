@@ -0,0 +1,223 @@
+"""
+Live telemetry for long benchmark runs. The performance runner emits one JSON event per line (run, test and
+iteration progress) to a file or a local Unix socket, and can expose the latest state as Prometheus text on
+a localhost HTTP endpoint, so a controller can show ETA, spot stalled or outlier iterations and see when a
+test's result has settled.
+"""
+
+import json
+import logging
+import math
+import socket
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+UNIX_PREFIX = "unix:"
+
+# Iterations further than this many median absolute deviations from the median are flagged as outliers
+OUTLIER_MADS = 5.0
+OUTLIER_MIN_SAMPLES = 5
+
+
+# Two-sided 95% Student-t quantiles for 1..30 degrees of freedom
+T_95 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+]  # fmt: skip
+# Beyond 30 degrees of freedom, use the value at the nearest tabulated df below (slightly conservative)
+T_95_LARGE_DF = ((120, 1.980), (60, 2.000), (40, 2.021), (30, 2.042))
+
+
+def t_quantile_95(df: int) -> float:
+    """Two-sided 95% Student-t quantile for df degrees of freedom."""
+    if df <= len(T_95):
+        return T_95[df - 1]
+    for min_df, value in T_95_LARGE_DF:
+        if df >= min_df:
+            return value
+
+
+def relative_ci(times) -> float:
+    """Half-width of the 95% Student-t confidence interval of the mean, relative to the mean."""
+    if len(times) < 2:
+        return math.inf
+    mean = statistics.mean(times)
+    if mean <= 0:
+        return math.inf
+    return t_quantile_95(len(times) - 1) * statistics.stdev(times) / math.sqrt(len(times)) / mean
+
+
+def is_outlier(times, value: float) -> bool:
+    """Flag value if it lies far outside the spread of the previous times."""
+    if len(times) < OUTLIER_MIN_SAMPLES:
+        return False
+    median = statistics.median(times)
+    mad = statistics.median(abs(t - median) for t in times)
+    return mad > 0 and abs(value - median) > OUTLIER_MADS * mad
+
+
+def _label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.server.telemetry.render_metrics().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Telemetry:
+    """
+    Structured event stream for the performance runner.
+
+    Args:
+        target: JSONL file path, "unix:/path/to.sock" for a listening Unix socket, or None for no stream
+        metrics_port: Serve Prometheus text on 127.0.0.1:metrics_port/metrics (0 disables it)
+    """
+
+    METRICS = {
+        "benchmark_iterations_completed": "Iterations finished for the current test",
+        "benchmark_iterations_planned": "Iterations requested for the current test",
+        "benchmark_last_iteration_seconds": "Timed duration of the last iteration",
+        "benchmark_mean_iteration_seconds": "Mean timed duration of the iterations so far",
+        "benchmark_relative_ci": "Relative 95% confidence half-width of the mean time",
+        "benchmark_eta_seconds": "Estimated wall time until the current test finishes",
+        "benchmark_outliers": "Iterations of the current test flagged as outliers",
+        "benchmark_settled": "1 once the test was stopped early because its result settled",
+        "benchmark_tests_completed": "Tests finished for the implementation",
+        "benchmark_tests_total": "Tests scheduled for the implementation",
+        "benchmark_run_eta_seconds": "Estimated wall time until every scheduled test has finished",
+    }
+
+    def __init__(self, target: str = None, metrics_port: int = 0):
+        self._lock = threading.Lock()
+        self._file = None
+        self._socket = None
+        self._server = None
+        self._gauges = {}
+        self._last_event_time = time.time()
+
+        if target and target.startswith(UNIX_PREFIX):
+            try:
+                self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._socket.connect(target[len(UNIX_PREFIX) :])
+            except OSError as e:
+                logging.warning(f"Telemetry socket unavailable, events will not be streamed: {e}")
+                self._socket = None
+        elif target:
+            self._file = open(target, "a", buffering=1)
+
+        if metrics_port:
+            self._server = ThreadingHTTPServer(("127.0.0.1", metrics_port), _MetricsHandler)
+            self._server.telemetry = self
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+            logging.info(f"Serving Prometheus metrics on http://127.0.0.1:{metrics_port}/metrics")
+
+    def emit(self, event: str, **fields):
+        """Write one event and update the exported gauges."""
+        record = {"ts": time.time(), "event": event, **fields}
+        line = json.dumps(record, default=str) + "\n"
+
+        with self._lock:
+            self._last_event_time = record["ts"]
+            self._update_gauges(record)
+
+            if self._file is not None:
+                self._file.write(line)
+            if self._socket is not None:
+                try:
+                    self._socket.sendall(line.encode())
+                except OSError as e:
+                    logging.warning(f"Telemetry socket closed, events will not be streamed: {e}")
+                    self._socket.close()
+                    self._socket = None
+
+    def _set(self, name: str, labels: dict, value):
+        self._gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def _update_gauges(self, record: dict):
+        impl = {"implementation": record.get("implementation", "")}
+        test = {**impl, "test": record.get("test", "")}
+        event = record["event"]
+
+        if event == "run_start":
+            self._set("benchmark_tests_total", impl, record["tests_total"])
+            self._set("benchmark_tests_completed", impl, 0)
+        elif event == "test_start":
+            self._set("benchmark_iterations_planned", test, record["num_runs"])
+            self._set("benchmark_iterations_completed", test, 0)
+            self._set("benchmark_outliers", test, 0)
+            self._set("benchmark_settled", test, 0)
+        elif event == "iteration":
+            self._set("benchmark_iterations_completed", test, record["iteration"])
+            if record["status"] == "ok":
+                self._set("benchmark_last_iteration_seconds", test, record["time"])
+                self._set("benchmark_mean_iteration_seconds", test, record["mean_time"])
+                if record["relative_ci"] is not None:
+                    self._set("benchmark_relative_ci", test, record["relative_ci"])
+            self._set("benchmark_eta_seconds", test, record["eta_seconds"])
+            self._set("benchmark_run_eta_seconds", impl, record["run_eta_seconds"])
+            if record.get("outlier"):
+                key = ("benchmark_outliers", tuple(sorted(test.items())))
+                self._gauges[key] = self._gauges.get(key, 0) + 1
+        elif event == "test_settled":
+            self._set("benchmark_settled", test, 1)
+        elif event == "test_end":
+            self._set("benchmark_eta_seconds", test, 0)
+            self._set("benchmark_run_eta_seconds", impl, record["run_eta_seconds"])
+            self._set("benchmark_tests_completed", impl, record["tests_completed"])
+        elif event == "test_error":
+            self._set("benchmark_tests_completed", impl, record["tests_completed"])
+        elif event == "run_end":
+            self._set("benchmark_run_eta_seconds", impl, 0)
+
+    def render_metrics(self) -> str:
+        """Render the current gauges in the Prometheus text exposition format."""
+        with self._lock:
+            gauges = dict(self._gauges)
+            since_last_event = time.time() - self._last_event_time
+
+        lines = []
+        for name, help_text in self.METRICS.items():
+            samples = [(labels, value) for (metric, labels), value in gauges.items() if metric == name]
+            if not samples:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in samples:
+                label_str = ",".join(f'{key}="{_label_value(val)}"' for key, val in labels)
+                lines.append(f"{name}{{{label_str}}} {value}")
+
+        # Lets a scraper detect stalled iterations without any extra event traffic
+        lines.append("# HELP benchmark_seconds_since_last_event Seconds since the runner last emitted an event")
+        lines.append("# TYPE benchmark_seconds_since_last_event gauge")
+        lines.append(f"benchmark_seconds_since_last_event {since_last_event:.3f}")
+        return "\n".join(lines) + "\n"
+
+    def close(self):
+        """Flush and release the stream and stop the metrics server."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self._socket is not None:
+                self._socket.close()
+                self._socket = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
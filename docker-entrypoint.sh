@@ -41,6 +41,19 @@ log "INFO" "Starting benchmark suite for implementation: $IMPLEMENTATION"
 
 # Build the common arguments string
 ARGS="--runs ${RUNS} --prime-upper-bound ${PRIME_UPPER_BOUND} --matrix-dimension ${MATRIX_DIMENSION} --fibonacci-length ${FIBONACCI_LENGTH}"
+ARGS="$ARGS --batch-size ${BATCH_SIZE:-0} --batch-matrix-dimension ${BATCH_MATRIX_DIMENSION:-8}"
+ARGS="$ARGS --batch-prime-bound ${BATCH_PRIME_BOUND:-10000}"
+ARGS="$ARGS --memory-sample-interval ${MEMORY_SAMPLE_INTERVAL:-0.001}"
+if [ "${TRACE_ALLOCATIONS:-0}" = "1" ]; then
+    ARGS="$ARGS --trace-allocations"
+fi
+ARGS="$ARGS --metrics-port ${METRICS_PORT:-0} --settle-threshold ${SETTLE_THRESHOLD:-0} --min-runs ${MIN_RUNS:-3}"
+if [ -n "${TELEMETRY}" ]; then
+    if [[ "${TELEMETRY}" != unix:* ]]; then
+        mkdir -p "$(dirname "${TELEMETRY}")"
+    fi
+    ARGS="$ARGS --telemetry ${TELEMETRY}"
+fi
 
 case "$IMPLEMENTATION" in
     "all")
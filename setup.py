@@ -32,6 +32,12 @@ extensions = [
         ["src/numpy/memory_test_cython.pyx"],
         include_dirs=[numpy.get_include()],
     ),
+    # Calibration kernels
+    Extension(
+        "src.numpy.stream_cython",
+        ["src/numpy/stream_cython.pyx"],
+        include_dirs=[numpy.get_include()],
+    ),
 ]
 
 setup(
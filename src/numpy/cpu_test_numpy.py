@@ -52,6 +52,42 @@ def calculate_primes(limit: int) -> List[int]:
     return list(np.nonzero(sieve)[0])
 
 
+def generate_candidates(count: int, limit: int) -> np.ndarray:
+    """
+    Generate random integers in [2, limit] to be tested for primality.
+
+    Args:
+        count: Number of candidates to generate
+        limit: Largest candidate value
+
+    Returns:
+        np.ndarray: Integer array of candidates
+    """
+    return np.random.randint(2, limit + 1, size=count)
+
+
+def are_primes(values: np.ndarray) -> np.ndarray:
+    """
+    Vectorized primality test: sieve once up to the largest value, then look every value up.
+
+    Args:
+        values: Array of non-negative integers to test
+
+    Returns:
+        np.ndarray: Boolean array where True indicates the corresponding value is prime
+
+    Raises:
+        ValueError: If any value is negative
+    """
+    if values.size == 0:
+        return np.zeros(0, dtype=bool)
+    if values.min() < 0:
+        raise ValueError("Primality candidates must be non-negative")
+
+    sieve = is_prime_array(max(int(values.max()), 2))
+    return sieve[values]
+
+
 def run_cpu_test(limit: int) -> List[int]:
     """
     Run CPU-bound test to calculate prime numbers using NumPy.
@@ -65,6 +101,33 @@ def run_cpu_test(limit: int) -> List[int]:
     return calculate_primes(limit)
 
 
+def generate_batch_inputs(limit: int, batch_size: int) -> tuple:
+    """
+    Build the arguments for run_cpu_batch_test once, so input generation stays out of the timed call.
+
+    Args:
+        limit: Largest candidate value
+        batch_size: Number of primality checks per call
+
+    Returns:
+        tuple: Positional arguments for run_cpu_batch_test
+    """
+    return (generate_candidates(batch_size, limit),)
+
+
+def run_cpu_batch_test(candidates: np.ndarray) -> np.ndarray:
+    """
+    Run CPU-bound throughput test: check primality of many small numbers in one vectorized call.
+
+    Args:
+        candidates: Numbers to test, from generate_batch_inputs
+
+    Returns:
+        np.ndarray: Boolean array of primality results
+    """
+    return are_primes(candidates)
+
+
 if __name__ == "__main__":
     primes = run_cpu_test(10000)
     print(f"Found {len(primes)} prime numbers.")
@@ -11,6 +11,16 @@ def generate_matrix(rows, cols):
     return np.random.rand(rows, cols)
 
 
+def batch_matrix_multiply(A, B):
+    """Multiply two stacks of matrices with a single np.matmul call."""
+    return np.matmul(A, B)
+
+
+def generate_matrix_batch(batch_size, rows, cols):
+    """Generate a (batch_size, rows, cols) stack of random matrices using NumPy."""
+    return np.random.rand(batch_size, rows, cols)
+
+
 def run_memory_test(matrix_size):
     """Run memory-bound test with NumPy matrix multiplication."""
     A = generate_matrix(matrix_size, matrix_size)
@@ -18,6 +28,18 @@ def run_memory_test(matrix_size):
     return matrix_multiply(A, B)
 
 
+def generate_batch_inputs(matrix_size, batch_size):
+    """Build the operand stacks for run_memory_batch_test once, outside the timed call."""
+    A = generate_matrix_batch(batch_size, matrix_size, matrix_size)
+    B = generate_matrix_batch(batch_size, matrix_size, matrix_size)
+    return A, B
+
+
+def run_memory_batch_test(A, B):
+    """Run throughput test with many small NumPy matrix multiplications stacked into one call."""
+    return batch_matrix_multiply(A, B)
+
+
 if __name__ == "__main__":
     result = run_memory_test(500)
     print(f"Matrix multiplication completed. Result matrix shape: {result.shape}")
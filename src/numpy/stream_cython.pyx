@@ -0,0 +1,17 @@
+# cython: boundscheck=False, wraparound=False, nonecheck=False
+"""Cython STREAM triad kernel used to calibrate the host's memory bandwidth."""
+import numpy as np
+cimport numpy as np
+
+# Initialize NumPy C API
+np.import_array()
+
+
+def triad(double[::1] a, const double[::1] b, const double[::1] c, double scalar):
+    """Compute a = b + scalar * c in a single pass without the GIL (24 bytes of traffic per element)."""
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = a.shape[0]
+
+    with nogil:
+        for i in range(n):
+            a[i] = b[i] + scalar * c[i]
@@ -2,6 +2,8 @@
 from typing import List
 from cpython cimport array
 import array
+from libc.stdlib cimport rand, srand
+from libc.time cimport time
 
 # Declare C-level types for better performance
 cdef bint is_prime_cy(int n) nogil:
@@ -56,4 +58,51 @@ def run_cpu_test(int limit = 10000) -> List[int]:
     Returns:
         List[int]: List of calculated prime numbers
     """
-    return calculate_primes(limit) 
\ No newline at end of file
+    return calculate_primes(limit)
+
+
+def generate_batch_inputs(int limit, int batch_size) -> tuple:
+    """
+    Build the arguments for run_cpu_batch_test once, so input generation stays out of the timed call.
+    
+    Args:
+        limit: Largest candidate value
+        batch_size: Number of primality checks per call
+        
+    Returns:
+        tuple: Positional arguments for run_cpu_batch_test
+    """
+    cdef array.array values = array.clone(array.array('i'), batch_size, zero=False)
+    cdef int* vals = values.data.as_ints
+    cdef int i
+    
+    # Seed random number generator
+    srand(time(NULL))
+    
+    for i in range(batch_size):
+        vals[i] = 2 + rand() % (limit - 1)
+        
+    return (values,)
+
+
+def run_cpu_batch_test(array.array candidates) -> List[bool]:
+    """
+    Run CPU-bound throughput test: check primality of many small numbers using Cython.
+    
+    Args:
+        candidates: array('i') of numbers to test, from generate_batch_inputs
+        
+    Returns:
+        List[bool]: Primality result for each candidate
+    """
+    cdef int count = len(candidates)
+    cdef array.array flags = array.clone(array.array('b'), count, zero=False)
+    cdef int* vals = candidates.data.as_ints
+    cdef signed char* out = flags.data.as_schars
+    cdef int i
+    
+    with nogil:
+        for i in range(count):
+            out[i] = is_prime_cy(vals[i])
+            
+    return [flag != 0 for flag in flags]
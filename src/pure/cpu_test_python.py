@@ -1,5 +1,6 @@
 """Pure Python implementation of CPU-intensive prime number calculations."""
 
+import random
 from typing import List
 
 
@@ -39,6 +40,20 @@ def calculate_primes(limit: int) -> List[int]:
     return [num for num in range(2, limit + 1) if is_prime(num)]
 
 
+def generate_candidates(count: int, limit: int) -> List[int]:
+    """
+    Generate random integers in [2, limit] to be tested for primality.
+
+    Args:
+        count: Number of candidates to generate
+        limit: Largest candidate value
+
+    Returns:
+        List[int]: List of candidates
+    """
+    return [random.randint(2, limit) for _ in range(count)]
+
+
 def run_cpu_test(limit: int) -> List[int]:
     """
     Run CPU-bound test to calculate prime numbers.
@@ -52,6 +67,33 @@ def run_cpu_test(limit: int) -> List[int]:
     return calculate_primes(limit)
 
 
+def generate_batch_inputs(limit: int, batch_size: int) -> tuple:
+    """
+    Build the arguments for run_cpu_batch_test once, so input generation stays out of the timed call.
+
+    Args:
+        limit: Largest candidate value
+        batch_size: Number of primality checks per call
+
+    Returns:
+        tuple: Positional arguments for run_cpu_batch_test
+    """
+    return (generate_candidates(batch_size, limit),)
+
+
+def run_cpu_batch_test(candidates: List[int]) -> List[bool]:
+    """
+    Run CPU-bound throughput test: check primality of many small numbers.
+
+    Args:
+        candidates: Numbers to test, from generate_batch_inputs
+
+    Returns:
+        List[bool]: Primality result for each candidate
+    """
+    return [is_prime(num) for num in candidates]
+
+
 if __name__ == "__main__":
     primes = run_cpu_test(10000)
     print(f"Found {len(primes)} prime numbers.")
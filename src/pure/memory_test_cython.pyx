@@ -3,6 +3,8 @@ from libc.stdlib cimport malloc, free
 from libc.math cimport sqrt
 from libc.time cimport time
 from libc.stdlib cimport rand, RAND_MAX, srand
+from cpython cimport array
+import array
 
 cdef double** create_matrix(int rows, int cols):
     """Create a 2D matrix using C arrays."""
@@ -66,4 +68,48 @@ def run_memory_test(int matrix_size=500):
     free_matrix(B, matrix_size)
     free_matrix(result, matrix_size)
     
-    return python_result 
\ No newline at end of file
+    return python_result
+
+cdef void matrix_multiply_flat(double* A, double* B, double* result, int n) noexcept nogil:
+    """Multiply two row-major NxN matrices stored in flat C buffers."""
+    cdef int i, j, k
+    cdef double temp
+    
+    for i in range(n):
+        for j in range(n):
+            temp = 0
+            for k in range(n):
+                temp += A[i * n + k] * B[k * n + j]
+            result[i * n + j] = temp
+
+def generate_batch_inputs(int matrix_size=8, int batch_size=1000):
+    """Build the operands for run_memory_batch_test once, outside the timed call, as flat array('d') buffers."""
+    cdef Py_ssize_t total = <Py_ssize_t>batch_size * matrix_size * matrix_size
+    cdef array.array A = array.clone(array.array('d'), total, zero=False)
+    cdef array.array B = array.clone(array.array('d'), total, zero=False)
+    cdef Py_ssize_t i
+    
+    # Seed random number generator
+    srand(time(NULL))
+    
+    for i in range(total):
+        A.data.as_doubles[i] = rand() / float(RAND_MAX)
+        B.data.as_doubles[i] = rand() / float(RAND_MAX)
+    
+    return A, B, matrix_size
+
+def run_memory_batch_test(array.array A, array.array B, int matrix_size=8):
+    """Run throughput test with many small pure C matrix multiplications."""
+    cdef Py_ssize_t size = matrix_size * matrix_size
+    cdef Py_ssize_t batch_size = len(A) // size
+    cdef double* result = <double*>malloc(size * sizeof(double))
+    cdef Py_ssize_t b
+    cdef int i, j
+    cdef list results = []
+    
+    for b in range(batch_size):
+        matrix_multiply_flat(&A.data.as_doubles[b * size], &B.data.as_doubles[b * size], result, matrix_size)
+        results.append([[result[i * matrix_size + j] for j in range(matrix_size)] for i in range(matrix_size)])
+    
+    free(result)
+    return results
@@ -33,6 +33,18 @@ def run_memory_test(matrix_size):
     return matrix_multiply(A, B)
 
 
+def generate_batch_inputs(matrix_size, batch_size):
+    """Build the operand lists for run_memory_batch_test once, outside the timed call."""
+    As = [generate_matrix(matrix_size, matrix_size) for _ in range(batch_size)]
+    Bs = [generate_matrix(matrix_size, matrix_size) for _ in range(batch_size)]
+    return As, Bs
+
+
+def run_memory_batch_test(As, Bs):
+    """Run throughput test with many small pure Python matrix multiplications."""
+    return [matrix_multiply(A, B) for A, B in zip(As, Bs)]
+
+
 if __name__ == "__main__":
     result = run_memory_test(500)
     print(f"Matrix multiplication completed. Result matrix size: {len(result)}x{len(result[0])}")